@@ -1,10 +1,20 @@
 #!/usr/bin/env python3
 import argparse
+import concurrent.futures
 import datetime
+import functools
 import json
+import mmap
+import os
+import re
+import shlex
 import shutil
+import stat
 import subprocess
 import sys
+import tempfile
+import time
+import zipfile
 from pathlib import Path
 
 try:
@@ -13,6 +23,75 @@ except ImportError:
     print("ERROR: This script requires PyYAML. Install it with: pip install pyyaml")
     sys.exit(1)
 
+try:
+    # Optional: streams rclone listings instead of loading them whole
+    import ijson
+    ijson_error = ijson.JSONError
+except ImportError:
+    ijson = None
+    ijson_error = ValueError
+
+try:
+    # libyaml-backed loader, much faster when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+# Compressors for tarballs. "command" runs inside the volume export
+# container, "host_command" on the host (the level flag is appended).
+COMPRESSORS = {
+    "zstd": {
+        "suffix": ".tar.zst",
+        "package": "zstd",
+        "command": "zstd -T0 -{level} -q -c",
+        "host_command": ["zstd", "-T0", "-q", "-c"],
+        "default_level": 3,
+        "levels": list(range(1, 20)),
+        "levels_text": "1-19",
+    },
+    "gzip": {
+        "suffix": ".tar.gz",
+        "package": "pigz",
+        "command": "pigz -{level} -p $(nproc) -c",
+        "host_command": ["pigz", "-c"],
+        "default_level": 1,
+        "levels": list(range(1, 10)) + [11],
+        "levels_text": "1-9 or 11",
+    },
+}
+DEFAULT_COMPRESSION = "zstd"
+
+# Volume exports run in a local image derived from alpine with the
+# compressor preinstalled, so they need no network once it exists.
+EXPORT_BASE_IMAGE = "alpine"
+EXPORT_IMAGE_PREFIX = "docker-compose-backup-export"
+
+# Volume sources that are host paths rather than named volumes: they start
+# with ".", "/" or "~", contain a "/", or are Windows drive paths ("C:\\data").
+_HOST_PATH_RE = re.compile(r"^[./~]|/|^[A-Za-z]:[\\/]")
+_WINDOWS_DRIVE_RE = re.compile(r"^[A-Za-z]:\\")
+
+# Chunk size used when streaming exports into the final zip.
+COPY_BUFSIZE = 1024 * 1024
+
+
+def resolve_compression_level(compression: str, compression_level=None) -> int:
+    """
+    Return the level to use for `compression`, or its default when None.
+
+    Raises ValueError for levels the compressor does not support.
+    """
+    compressor = COMPRESSORS[compression]
+    if compression_level is None:
+        return compressor["default_level"]
+    if compression_level not in compressor["levels"]:
+        raise ValueError(
+            f"Invalid compression level {compression_level} for {compression}; "
+            f"use {compressor['levels_text']}"
+        )
+    return compression_level
+
 
 def run_cmd(cmd, cwd=None):
     """Run a shell command and raise if it fails."""
@@ -22,6 +101,19 @@ def run_cmd(cmd, cwd=None):
         raise RuntimeError(f"Command failed with exit code {result.returncode}: {' '.join(cmd)}")
 
 
+def start_cmd(cmd, cwd=None) -> subprocess.Popen:
+    """Start a shell command in the background; pair with wait_cmd."""
+    print(f"+ Starting: {' '.join(cmd)}")
+    return subprocess.Popen(cmd, cwd=cwd)
+
+
+def wait_cmd(proc: subprocess.Popen):
+    """Wait for a command started with start_cmd and raise if it failed."""
+    returncode = proc.wait()
+    if returncode != 0:
+        raise RuntimeError(f"Command failed with exit code {returncode}: {' '.join(proc.args)}")
+
+
 def find_compose_file(project_dir: Path) -> Path:
     """Find a docker-compose file in the given directory."""
     candidates = [
@@ -40,6 +132,104 @@ def find_compose_file(project_dir: Path) -> Path:
     )
 
 
+class _FullLoadNeeded(Exception):
+    """The compose file uses YAML features the pruned reader does not follow."""
+
+
+def _yaml_scalar(event):
+    """Return a scalar event's value, mapping plain null spellings to None."""
+    if event.implicit[0] and event.value in ("", "~", "null", "Null", "NULL"):
+        return None
+    return event.value
+
+
+def _yaml_build(events, event):
+    """Build the Python value of the node starting at `event`."""
+    if isinstance(event, yaml.ScalarEvent):
+        return _yaml_scalar(event)
+    if isinstance(event, yaml.SequenceStartEvent):
+        items = []
+        for item_event in events:
+            if isinstance(item_event, yaml.SequenceEndEvent):
+                return items
+            items.append(_yaml_build(events, item_event))
+    if isinstance(event, yaml.MappingStartEvent):
+        mapping = {}
+        for key_event in events:
+            if isinstance(key_event, yaml.MappingEndEvent):
+                return mapping
+            key = _yaml_build(events, key_event)
+            if key == "<<":
+                raise _FullLoadNeeded()
+            mapping[key] = _yaml_build(events, next(events))
+    # Aliases (and anything unexpected) need the real loader to resolve.
+    raise _FullLoadNeeded()
+
+
+def _yaml_skip(events, event):
+    """Consume the node starting at `event` without building it."""
+    if not isinstance(event, (yaml.SequenceStartEvent, yaml.MappingStartEvent)):
+        return
+    depth = 1
+    for inner in events:
+        if isinstance(inner, (yaml.SequenceStartEvent, yaml.MappingStartEvent)):
+            depth += 1
+        elif isinstance(inner, (yaml.SequenceEndEvent, yaml.MappingEndEvent)):
+            depth -= 1
+            if depth == 0:
+                return
+
+
+def _yaml_mapping_items(events, event):
+    """Yield (key, value start event) pairs of the mapping starting at `event`."""
+    for key_event in events:
+        if isinstance(key_event, yaml.MappingEndEvent):
+            return
+        key = _yaml_build(events, key_event)
+        if key == "<<":
+            raise _FullLoadNeeded()
+        yield key, next(events)
+
+
+def _load_compose_volume_sections(stream):
+    """
+    Load only `services.*.volumes` and the top-level `volumes` of a compose file.
+
+    Walks the YAML event stream and builds Python objects just for those
+    sections, skipping everything else. Raises _FullLoadNeeded when an alias
+    or merge key could pull data into them from elsewhere.
+    """
+    events = iter(yaml.parse(stream, Loader=SafeLoader))
+    for event in events:
+        if isinstance(event, yaml.MappingStartEvent):
+            break
+        if isinstance(event, (yaml.NodeEvent, yaml.StreamEndEvent)):
+            # Empty document or a root that is not a mapping
+            return {}
+
+    data = {}
+    for key, value_event in _yaml_mapping_items(events, event):
+        if key == "volumes":
+            data["volumes"] = _yaml_build(events, value_event)
+        elif key == "services" and isinstance(value_event, yaml.MappingStartEvent):
+            services = data["services"] = {}
+            for name, svc_event in _yaml_mapping_items(events, value_event):
+                if not isinstance(svc_event, yaml.MappingStartEvent):
+                    services[name] = _yaml_build(events, svc_event)
+                    continue
+                svc = services[name] = {}
+                for svc_key, svc_value_event in _yaml_mapping_items(events, svc_event):
+                    if svc_key == "volumes":
+                        svc["volumes"] = _yaml_build(events, svc_value_event)
+                    else:
+                        _yaml_skip(events, svc_value_event)
+        elif key == "services":
+            data["services"] = _yaml_build(events, value_event)
+        else:
+            _yaml_skip(events, value_event)
+    return data
+
+
 def extract_named_volumes(compose_path: Path):
     """
     Extract the Docker volume names used by services.
@@ -50,8 +240,18 @@ def extract_named_volumes(compose_path: Path):
     - If that volume defines "name:", use it
     - Otherwise use the key itself (default volume name)
     """
-    with compose_path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    # Hand the parser the raw bytes through mmap; it detects the encoding
+    # itself, which skips Python's text decoding layer.
+    with compose_path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            data = None
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                try:
+                    data = _load_compose_volume_sections(mm)
+                except _FullLoadNeeded:
+                    mm.seek(0)
+                    data = yaml.load(mm, Loader=SafeLoader)
 
     services = (data or {}).get("services", {})
     top_volumes = (data or {}).get("volumes", {})
@@ -63,6 +263,10 @@ def extract_named_volumes(compose_path: Path):
 
             # Parse volume source (left side before ":")
             if isinstance(v, str):
+                # "C:\\data:/x" would split at the drive colon; "c:/data" is
+                # left alone since it also reads as volume "c" at /data
+                if _WINDOWS_DRIVE_RE.match(v):
+                    continue
                 volkey = v.split(":", 1)[0]
             elif isinstance(v, dict):
                 volkey = v.get("source")
@@ -72,8 +276,8 @@ def extract_named_volumes(compose_path: Path):
             if not volkey:
                 continue
 
-            # Skip host paths: they usually contain "/" or start with "." or "~"
-            if "/" in volkey or volkey.startswith(".") or volkey.startswith("~"):
+            # Skip host paths (see _HOST_PATH_RE)
+            if _HOST_PATH_RE.search(volkey):
                 continue
 
             # Check if this volume is defined in the top-level volumes section
@@ -92,9 +296,13 @@ def extract_named_volumes(compose_path: Path):
 
 
 
+@functools.lru_cache(maxsize=1)
 def detect_docker_compose_command():
     """
     Prefer 'docker compose' (plugin, v2). Fall back to 'docker-compose' if needed.
+
+    The result is cached, so repeated backups in one run only probe once.
+    Callers must not mutate the returned list.
     """
     try:
         result = subprocess.run(
@@ -124,65 +332,394 @@ def detect_docker_compose_command():
     )
 
 
-def create_project_zip(project_dir: Path, timestamp: str) -> Path:
+def host_tools_available(compression: str = DEFAULT_COMPRESSION) -> bool:
+    """Return True if the host has tar and the compressor for `compression`."""
+    return bool(shutil.which("tar") and shutil.which(COMPRESSORS[compression]["host_command"][0]))
+
+
+def create_project_archive(
+    project_dir: Path,
+    timestamp: str,
+    compression: str = DEFAULT_COMPRESSION,
+    compression_level=None,
+) -> Path:
     """
-    Create a zip archive of the entire project directory.
+    Create an archive of the entire project directory.
+
+    Uses the host's tar piped into the selected compressor (multi-threaded
+    zstd or pigz) and falls back to a plain zip when that compressor is not
+    installed. Backup temp directories are excluded.
 
-    IMPORTANT: The zip is created in the *parent directory* of the project
-    so that any later-created temp directories inside the project are NOT
-    included in this archive.
+    IMPORTANT: The archive is created in the *parent directory* of the
+    project so that it does not end up inside itself.
     """
     project_name = project_dir.name
-    zip_base = project_dir.parent / f"{project_name}-project-{timestamp}"
+    archive_base = project_dir.parent / f"{project_name}-project-{timestamp}"
+    compressor = COMPRESSORS[compression]
+
+    if not host_tools_available(compression):
+        return create_project_zip(project_dir, archive_base.parent / f"{archive_base.name}.zip")
+
+    archive_path = archive_base.parent / f"{archive_base.name}{compressor['suffix']}"
+    print(f"Creating project archive of {project_dir} at {archive_path}")
+    with archive_path.open("wb") as out:
+        tar_directory_on_host(
+            project_dir,
+            out,
+            compression,
+            compression_level,
+            exclude=".docker-backup-temp-*",
+        )
+    return archive_path
+
+
+def create_project_zip(project_dir: Path, zip_path: Path) -> Path:
+    """
+    Zip the project directory with fast DEFLATE (level 1).
 
-    print(f"Creating project zip of {project_dir} at {zip_base}.zip")
-    shutil.make_archive(
-        base_name=str(zip_base),
-        format="zip",
-        root_dir=str(project_dir),
+    Fallback for hosts without tar or the compressor. Backup temp
+    directories are skipped, and like shutil.make_archive only regular
+    files (or symlinks to them) are stored, so dangling links are ignored.
+    """
+    print(f"Creating project zip of {project_dir} at {zip_path}")
+    # allowZip64 only writes ZIP64 records when the size, entry count or
+    # offsets actually need them.
+    with zipfile.ZipFile(
+        zip_path,
+        "w",
+        compression=zipfile.ZIP_DEFLATED,
+        compresslevel=1,
+        allowZip64=True,
+    ) as zf:
+        for root, dirs, names in os.walk(project_dir):
+            dirs[:] = sorted(d for d in dirs if not d.startswith(".docker-backup-temp-"))
+            # Keep directory entries so empty directories survive a restore
+            for name in dirs:
+                path = Path(root) / name
+                zf.write(path, arcname=path.relative_to(project_dir).as_posix())
+            for name in sorted(names):
+                path = Path(root) / name
+                if os.path.isfile(path):
+                    zf.write(path, arcname=path.relative_to(project_dir).as_posix())
+    return zip_path
+
+
+def tar_directory_on_host(
+    directory: Path,
+    out,
+    compression: str = DEFAULT_COMPRESSION,
+    compression_level=None,
+    exclude=None,
+):
+    """
+    Write a compressed tarball of `directory` to the binary file object `out`.
+
+    Runs the host's tar piped into the selected compressor, so compression
+    uses every core without going through a container.
+    """
+    compressor = COMPRESSORS[compression]
+    level = resolve_compression_level(compression, compression_level)
+    tar_cmd = ["tar", "-C", str(directory)]
+    if exclude:
+        tar_cmd.append(f"--exclude={exclude}")
+    tar_cmd += ["-cf", "-", "."]
+    compress_cmd = compressor["host_command"] + [f"-{level}"]
+
+    print(f"+ Running: {' '.join(tar_cmd)} | {' '.join(compress_cmd)}")
+    tar = subprocess.Popen(tar_cmd, stdout=subprocess.PIPE)
+    compress = subprocess.Popen(compress_cmd, stdin=tar.stdout, stdout=subprocess.PIPE)
+    tar.stdout.close()
+    with compress.stdout:
+        shutil.copyfileobj(compress.stdout, out, COPY_BUFSIZE)
+    compress_code = compress.wait()
+    tar_code = tar.wait()
+
+    # GNU tar exits with 1 when files changed while being read; that is
+    # expected for a running stack and does not invalidate the archive.
+    if tar_code not in (0, 1):
+        raise RuntimeError(f"Command failed with exit code {tar_code}: {' '.join(tar_cmd)}")
+    if compress_code != 0:
+        raise RuntimeError(f"Command failed with exit code {compress_code}: {' '.join(compress_cmd)}")
+
+
+def volume_mountpoints(volumes):
+    """
+    Return {volume name: host mountpoint} for the given Docker volumes.
+
+    Uses a single `docker volume inspect` call for all of them, and raises
+    if any mountpoint is not readable by the current user.
+    """
+    if not volumes:
+        return {}
+    cmd = ["docker", "volume", "inspect", "--format", "{{.Name}}\t{{.Mountpoint}}", *volumes]
+    print(f"+ Running: {' '.join(cmd)}")
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Command failed with exit code {result.returncode}: {' '.join(cmd)}")
+
+    mountpoints = {}
+    for line in result.stdout.splitlines():
+        name, _, mountpoint = line.partition("\t")
+        if name and mountpoint:
+            mountpoints[name] = Path(mountpoint)
+    missing = [vol for vol in volumes if vol not in mountpoints]
+    if missing:
+        raise RuntimeError(f"No mountpoint reported for volumes: {', '.join(missing)}")
+    unreadable = [
+        str(mountpoints[vol]) for vol in volumes
+        if not os.access(mountpoints[vol], os.R_OK | os.X_OK)
+    ]
+    if unreadable:
+        raise RuntimeError(
+            "--direct-host-tar requires root (or read access to the volume "
+            f"mountpoints); cannot read: {', '.join(unreadable)}"
+        )
+    return mountpoints
+
+
+def prepare_export_image(compression: str = DEFAULT_COMPRESSION) -> str:
+    """
+    Return a local image with the compressor for `compression` preinstalled.
+
+    The image is built once from alpine (this needs network access) and
+    reused on later runs. Call it before stopping any services, so a failed
+    build leaves the stack running.
+    """
+    package = COMPRESSORS[compression]["package"]
+    image = f"{EXPORT_IMAGE_PREFIX}-{package}:latest"
+    result = subprocess.run(
+        ["docker", "image", "inspect", image],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
-    return zip_base.with_suffix(".zip")
+    if result.returncode == 0:
+        return image
+
+    print(f"Building volume export image {image} ...")
+    container = f"{EXPORT_IMAGE_PREFIX}-build-{os.getpid()}"
+    try:
+        run_cmd([
+            "docker", "run", "--name", container, EXPORT_BASE_IMAGE,
+            "apk", "add", "--no-cache", "--quiet", package,
+        ])
+        run_cmd(["docker", "commit", container, image])
+    finally:
+        subprocess.run(
+            ["docker", "rm", "-f", container],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    return image
+
+
+def volume_archive_name(volume_name: str, timestamp: str, compression: str = DEFAULT_COMPRESSION) -> str:
+    """Return the archive name used for an exported volume."""
+    return f"volume-{volume_name}-{timestamp}{COMPRESSORS[compression]['suffix']}"
 
 
-def export_volume(volume_name: str, temp_dir: Path, timestamp: str) -> Path:
+def export_volume(
+    volume_name: str,
+    out,
+    compression: str = DEFAULT_COMPRESSION,
+    compression_level=None,
+    image=None,
+):
     """
-    Export a Docker named volume to a .tar.gz file inside the temp directory.
+    Export a Docker named volume as a compressed tarball written to `out`.
+
+    The container writes the tarball to stdout and it is streamed into the
+    given binary file object (a final zip member or a file in temp_dir).
+    zstd produces a .tar.zst; gzip keeps the classic .tar.gz but compresses
+    with pigz on every available core. `image` comes from
+    prepare_export_image and is prepared on demand when omitted.
     """
-    archive_name = f"volume-{volume_name}-{timestamp}.tar.gz"
-    archive_path = temp_dir / archive_name
+    compressor = COMPRESSORS[compression]
+    level = resolve_compression_level(compression, compression_level)
+    image = image or prepare_export_image(compression)
 
     cmd = [
         "docker", "run", "--rm",
         "-v", f"{volume_name}:/volume",
-        "-v", f"{str(temp_dir)}:/backup",
-        "alpine",
+        image,
         "sh", "-c",
-        f"cd /volume && tar czf /backup/{archive_name} ."
+        f"set -o pipefail && cd /volume && tar -cf - . | {compressor['command'].format(level=level)}"
     ]
-    run_cmd(cmd)
-    return archive_path
+    print(f"+ Running: {' '.join(cmd)}")
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+    with proc.stdout:
+        shutil.copyfileobj(proc.stdout, out, COPY_BUFSIZE)
+    returncode = proc.wait()
+    if returncode != 0:
+        raise RuntimeError(f"Command failed with exit code {returncode}: {' '.join(cmd)}")
+
+
+def export_volumes_batch(
+    volumes,
+    temp_dir: Path,
+    timestamp: str,
+    compression: str = DEFAULT_COMPRESSION,
+    compression_level=None,
+    parallel: int = 1,
+    image=None,
+):
+    """
+    Export several Docker named volumes to files in temp_dir with one container.
 
+    All volumes are mounted into a single helper container that runs up to
+    `parallel` exports at a time, so the container start-up cost is paid once
+    instead of once per volume. Returns the archive paths in volume order.
+    """
+    compressor = COMPRESSORS[compression]
+    level = resolve_compression_level(compression, compression_level)
+    image = image or prepare_export_image(compression)
+    compress = compressor["command"].format(level=level)
+    archive_names = [volume_archive_name(vol, timestamp, compression) for vol in volumes]
+
+    mounts = []
+    lines = [
+        "set -o pipefail",
+        "status=0",
+        'pids=""',
+    ]
+    for index, (vol, archive_name) in enumerate(zip(volumes, archive_names)):
+        mounts += ["-v", f"{vol}:/volumes/{index}"]
+        lines.append(
+            f"(cd /volumes/{index} && tar -cf - . | {compress} > /backup/{shlex.quote(archive_name)}) &"
+        )
+        lines.append('pids="$pids $!"')
+        if (index + 1) % parallel == 0:
+            lines.append('for pid in $pids; do wait "$pid" || status=1; done; pids=""')
+    lines.append('for pid in $pids; do wait "$pid" || status=1; done')
+    lines.append('exit "$status"')
 
-def create_final_zip_from_temp(project_dir: Path, temp_dir: Path, timestamp: str) -> Path:
+    cmd = [
+        "docker", "run", "--rm",
+        *mounts,
+        "-v", f"{str(temp_dir)}:/backup",
+        image,
+        "sh", "-c",
+        "\n".join(lines),
+    ]
+    run_cmd(cmd)
+    return [temp_dir / archive_name for archive_name in archive_names]
+
+
+def zip_member_info(name: str) -> zipfile.ZipInfo:
+    """Return a stored ZipInfo for `name` stamped with the current time and mode 0644."""
+    info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+    info.compress_type = zipfile.ZIP_STORED
+    info.external_attr = (stat.S_IFREG | 0o644) << 16
+    return info
+
+
+def export_volumes(
+    volumes,
+    final_zip: zipfile.ZipFile,
+    temp_dir: Path,
+    timestamp: str,
+    compression: str = DEFAULT_COMPRESSION,
+    compression_level=None,
+    parallel: int = 1,
+    mountpoints=None,
+    image=None,
+):
     """
-    Zip everything in temp_dir into a single zip located in the project directory.
-    Name: <project_folder>-<timestamp>.zip
+    Export every named volume into final_zip.
+
+    With parallel == 1 each export is streamed straight into the zip, so the
+    data never touches the disk as a separate file. With parallel > 1 all
+    volumes are exported into temp_dir, and the finished files are then
+    stored in the zip in volume order.
+
+    When `mountpoints` (from volume_mountpoints) is given, the volumes are
+    tarred on the host (needs root) instead of through a helper container
+    per volume, or one shared container for parallel exports
+    (export_volumes_batch). `image` is the export image from
+    prepare_export_image.
     """
-    project_name = project_dir.name
-    final_base = project_dir / f"{project_name}-{timestamp}"
+    workers = min(len(volumes), parallel, os.cpu_count() or 1)
 
-    print(f"Creating final backup zip from {temp_dir} at {final_base}.zip")
-    shutil.make_archive(
-        base_name=str(final_base),
-        format="zip",
-        root_dir=str(temp_dir),
-    )
-    return final_base.with_suffix(".zip")
+    if mountpoints is not None:
+        def _export(vol, out):
+            tar_directory_on_host(mountpoints[vol], out, compression, compression_level)
+    else:
+        image = image or prepare_export_image(compression)
+
+        def _export(vol, out):
+            export_volume(vol, out, compression, compression_level, image)
+
+    if workers <= 1:
+        for vol in volumes:
+            print(f"Exporting volume: {vol}")
+            archive_name = volume_archive_name(vol, timestamp, compression)
+            with final_zip.open(zip_member_info(archive_name), "w", force_zip64=True) as member:
+                _export(vol, member)
+            print(f"Volume {vol} exported to: {final_zip.filename}:{archive_name}")
+        return
+
+    print(f"Exporting {len(volumes)} volumes with {workers} parallel jobs...")
+    if mountpoints is not None:
+        def _export_to_file(vol):
+            archive_path = temp_dir / volume_archive_name(vol, timestamp, compression)
+            with archive_path.open("wb") as out:
+                _export(vol, out)
+            return archive_path
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            # .result() re-raises the first export failure, if any
+            archive_paths = list(executor.map(_export_to_file, volumes))
+    else:
+        archive_paths = export_volumes_batch(
+            volumes, temp_dir, timestamp, compression, compression_level, workers, image
+        )
 
+    for vol, archive_path in zip(volumes, archive_paths):
+        info = zip_member_info(archive_path.name)
+        with archive_path.open("rb") as src, final_zip.open(info, "w", force_zip64=True) as member:
+            shutil.copyfileobj(src, member, COPY_BUFSIZE)
+        archive_path.unlink()
+        print(f"Volume {vol} exported to: {final_zip.filename}:{archive_path.name}")
 
-def rclone_copy_file(file_path: Path, remote: str, remote_path: str):
+
+# Upload tuning for large single-file archives: split the file across
+# several streams instead of relying on one TCP connection.
+RCLONE_COPY_ARGS = [
+    "--multi-thread-streams=4",
+    "--multi-thread-cutoff=100M",
+    "--transfers=8",
+    "--checkers=16",
+]
+RCLONE_S3_COPY_ARGS = ["--s3-upload-concurrency=8"]
+
+
+@functools.lru_cache(maxsize=None)
+def rclone_remote_type(remote: str):
+    """Return the backend type of an rclone remote (e.g. 's3'), or None if unknown."""
+    try:
+        result = subprocess.run(
+            ["rclone", "listremotes", "--long"],
+            capture_output=True,
+            text=True,
+        )
+    except FileNotFoundError:
+        return None
+    if result.returncode != 0:
+        return None
+
+    for line in result.stdout.splitlines():
+        name, _, remote_type = line.partition(":")
+        if name.strip() == remote:
+            return remote_type.strip() or None
+    return None
+
+
+def rclone_copy_file(file_path: Path, remote: str, remote_path: str, extra_args=None) -> subprocess.Popen:
     """
-    Copy a single file to the remote:path using rclone copy.
+    Start copying a single file to the remote:path using rclone copy.
+
+    extra_args are appended after the built-in tuning flags, so they can
+    override them. Returns the running process; use wait_cmd to wait for
+    the upload.
     """
     if remote_path:
         dest = f"{remote}:{remote_path}"
@@ -196,50 +733,75 @@ def rclone_copy_file(file_path: Path, remote: str, remote_path: str):
         dest,
         "--verbose",
     ]
-    run_cmd(cmd)
+    cmd += RCLONE_COPY_ARGS
+    if rclone_remote_type(remote) == "s3":
+        cmd += RCLONE_S3_COPY_ARGS
+    cmd += list(extra_args or [])
+    return start_cmd(cmd)
 
 
-def rotate_project_backups(remote: str, remote_path: str, keep: int):
-    """
-    Keep only the newest `keep` backup files in the given remote path.
-    Older backups are deleted using rclone deletefile.
+def list_project_backups(remote: str, remote_path: str):
     """
-    if keep < 1:
-        raise ValueError("keep must be at least 1")
+    List backup archives in the given remote path, sorted oldest first.
 
+    Returns the rclone lsjson entries of the backup files.
+    """
     target = f"{remote}:{remote_path}" if remote_path else f"{remote}:"
     print(f"Listing backups at {target} ...")
 
-    result = subprocess.run(
-        ["rclone", "lsjson", target, "--files-only"],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        err = result.stderr.strip() or "unknown error"
-        raise RuntimeError(f"Failed to list backups via rclone: {err}")
+    def _is_backup(entry) -> bool:
+        # Limit to zip files to avoid touching unexpected data in the same folder.
+        return not entry.get("IsDir") and str(entry.get("Path", "")).endswith(".zip")
 
-    try:
-        entries = json.loads(result.stdout or "[]")
-    except json.JSONDecodeError as exc:
-        raise RuntimeError(f"Unable to parse rclone output as JSON: {exc}") from exc
-
-    # Limit to zip files to avoid touching unexpected data in the same folder.
-    backups = [
-        entry for entry in entries
-        if not entry.get("IsDir") and str(entry.get("Path", "")).endswith(".zip")
-    ]
-
-    def _parse_time(mod_time: str):
-        if not mod_time:
-            return datetime.datetime.min
+    cmd = ["rclone", "lsjson", target, "--files-only", "--max-depth", "1"]
+    with tempfile.TemporaryFile() as stderr:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+        parse_error = None
+        backups = []
         try:
-            # rclone uses RFC3339 with a trailing Z
-            return datetime.datetime.fromisoformat(mod_time.replace("Z", "+00:00"))
-        except ValueError:
-            return datetime.datetime.min
+            with proc.stdout:
+                if ijson is not None:
+                    # Stream entries so huge folders never sit in memory at once
+                    entries = ijson.items(proc.stdout, "item")
+                else:
+                    entries = json.loads(proc.stdout.read() or b"[]")
+                # Keep only the fields rotation needs
+                backups = [
+                    {"Path": entry.get("Path"), "ModTime": entry.get("ModTime")}
+                    for entry in entries
+                    if _is_backup(entry)
+                ]
+        except (ValueError, ijson_error) as exc:
+            parse_error = exc
+        returncode = proc.wait()
+
+        if returncode != 0:
+            stderr.seek(0)
+            err = stderr.read().decode("utf-8", errors="replace").strip() or "unknown error"
+            raise RuntimeError(f"Failed to list backups via rclone: {err}")
+    if parse_error is not None:
+        raise RuntimeError(f"Unable to parse rclone output as JSON: {parse_error}") from parse_error
+
+    # rclone reports ModTime as RFC3339 in a fixed layout, so the strings
+    # sort chronologically without parsing them into datetimes.
+    backups.sort(key=lambda e: e.get("ModTime") or "")
+    return backups
+
+
+def rotate_project_backups(remote: str, remote_path: str, keep: int, backups=None):
+    """
+    Keep only the newest `keep` backup files in the given remote path.
+    Older backups are deleted with a single `rclone delete --files-from-raw`.
 
-    backups.sort(key=lambda e: _parse_time(e.get("ModTime")))
+    `backups` may be a listing from list_project_backups, sorted oldest
+    first, taken earlier; the remote is listed now when it is omitted.
+    """
+    if keep < 1:
+        raise ValueError("keep must be at least 1")
+
+    target = f"{remote}:{remote_path}" if remote_path else f"{remote}:"
+    if backups is None:
+        backups = list_project_backups(remote, remote_path)
 
     if len(backups) <= keep:
         print(f"Found {len(backups)} backups; nothing to delete (keep={keep}).")
@@ -248,38 +810,143 @@ def rotate_project_backups(remote: str, remote_path: str, keep: int):
     to_delete = backups[:-keep]
     print(f"Keeping newest {keep} backups, deleting {len(to_delete)} older backups...")
 
-    for entry in to_delete:
-        rel_path = entry.get("Path") or entry.get("Name")
-        if not rel_path:
-            continue
+    rel_paths = [entry.get("Path") or entry.get("Name") for entry in to_delete]
+    rel_paths = [rel_path for rel_path in rel_paths if rel_path]
+    if not rel_paths:
+        return
 
+    def _delete_target(rel_path: str) -> str:
         if remote_path:
-            delete_target = f"{remote}:{remote_path.rstrip('/')}/{rel_path}"
-        else:
-            delete_target = f"{remote}:{rel_path}"
+            return f"{remote}:{remote_path.rstrip('/')}/{rel_path}"
+        return f"{remote}:{rel_path}"
 
-        print(f"Deleting {delete_target}")
-        run_cmd(["rclone", "deletefile", delete_target])
+    for rel_path in rel_paths:
+        print(f"Deleting {_delete_target(rel_path)}")
 
+    # Delete everything in one rclone call instead of one process per file.
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as f:
+        f.write("\n".join(rel_paths) + "\n")
+        files_from = f.name
+    try:
+        cmd = ["rclone", "delete", target, f"--files-from-raw={files_from}"]
+        print(f"+ Running: {' '.join(cmd)}")
+        result = subprocess.run(cmd, stderr=subprocess.PIPE, text=True)
+    finally:
+        os.unlink(files_from)
+
+    if result.returncode == 0:
+        if result.stderr:
+            print(result.stderr, end="", file=sys.stderr)
+        return
+    if "unknown flag" not in (result.stderr or ""):
+        err = result.stderr.strip() or f"exit code {result.returncode}"
+        raise RuntimeError(f"Failed to delete old backups via rclone: {err}")
+
+    # Old rclone without --files-from-raw: fall back to one deletefile per backup.
+    print("rclone does not support --files-from-raw; deleting backups one by one.")
+    for rel_path in rel_paths:
+        run_cmd(["rclone", "deletefile", _delete_target(rel_path)])
+
+
+def finish_backup_upload(
+    upload: subprocess.Popen,
+    final_zip_path: Path,
+    remote: str,
+    remote_path: str,
+    backups_to_keep: int,
+    listing=None,
+):
+    """
+    Wait for the final zip upload, remove the local zip and rotate remote backups.
 
-def backup_project(project_dir, rclone_remote, remote_path, backups_to_keep: int = 4):
+    `listing` is an optional future for a list_project_backups call started
+    before the upload; the new zip is added to it as the newest backup. If
+    that early listing failed (e.g. the remote folder did not exist yet),
+    the remote is listed again.
+
+    On failure the local final zip is left in place for a manual upload.
+    """
+    try:
+        wait_cmd(upload)
+        print(f"rclone copy of {final_zip_path.name} completed.")
+
+        # 9) Remove local final backup zip as well
+        if final_zip_path.exists():
+            print(f"Removing local final backup zip: {final_zip_path}")
+            final_zip_path.unlink()
+
+        # 10) Rotate old backups on remote
+        print(f"Rotating backups on remote, keeping last {backups_to_keep} archives...")
+        backups = None
+        if listing is not None:
+            try:
+                backups = [
+                    entry for entry in listing.result()
+                    if entry.get("Path") != final_zip_path.name
+                ]
+                backups.append({"Path": final_zip_path.name})
+            except RuntimeError as exc:
+                print(f"Early backup listing failed ({exc}); listing again.")
+        rotate_project_backups(remote, remote_path, backups_to_keep, backups)
+        print("Backup rotation completed.")
+
+        print(f"\nBackup {final_zip_path.name} completed successfully.")
+    except Exception as e:
+        print(f"\nERROR: {e}")
+        if final_zip_path.exists():
+            print(f"Final zip preserved at: {final_zip_path}")
+        raise
+
+
+def backup_project(
+    project_dir,
+    rclone_remote,
+    remote_path,
+    backups_to_keep: int = 4,
+    compression: str = DEFAULT_COMPRESSION,
+    compression_level=None,
+    parallel: int = 1,
+    direct_host_tar: bool = False,
+    rclone_args=None,
+    docker_compose_cmd=None,
+    upload_queue=None,
+):
     """
     Run the full backup workflow. Accepts strings or Path-like objects.
 
     Returns the final zip Path (even though it is removed locally after upload).
     Raises on any failure; callers can catch to handle errors.
+
+    direct_host_tar exports volumes with the host's tar (see export_volumes).
+    rclone_args is an optional list of extra arguments for `rclone copy`.
+    docker_compose_cmd skips detection when the caller already resolved it.
+    If upload_queue (a queue.Queue) is given, the function waits for earlier
+    queued uploads to be marked done, returns as soon as its own upload has
+    started and puts a (project_dir, finish) tuple on the queue, with
+    project_dir as passed in. Calling finish() waits for the upload, cleans
+    up and rotates; the consumer must call task_done() afterwards.
     """
+    caller_project_dir = project_dir
     project_dir = Path(project_dir).resolve()
     if not project_dir.is_dir():
         raise FileNotFoundError(f"Project directory does not exist or is not a directory: {project_dir}")
+    resolve_compression_level(compression, compression_level)
 
     remote = rclone_remote
 
+    # List existing remote backups in the background while the local
+    # steps run; rotation only needs the result after the upload.
+    listing_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    listing = listing_executor.submit(list_project_backups, remote, remote_path)
+    listing_executor.shutdown(wait=False)
+
     timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
     project_name = project_dir.name
 
-    # 1) Create zip of whole project BEFORE any temp directory exists inside it
-    project_zip_outside = create_project_zip(project_dir, timestamp)
+    # 1) Archive the whole project BEFORE any temp directory exists inside it
+    project_archive_outside = create_project_archive(
+        project_dir, timestamp, compression, compression_level
+    )
 
     # 2) Now create temp directory *inside* project
     temp_dir = project_dir / f".docker-backup-temp-{timestamp}"
@@ -289,11 +956,11 @@ def backup_project(project_dir, rclone_remote, remote_path, backups_to_keep: int
         print(f"ERROR: Temp backup directory already exists (unexpected): {temp_dir}")
         sys.exit(1)
 
-    # Move the project zip into temp_dir (so all exports live together)
-    project_zip = temp_dir / project_zip_outside.name
-    shutil.move(str(project_zip_outside), str(project_zip))
+    # Move the project archive into temp_dir (so all backup artifacts live together)
+    project_archive = temp_dir / project_archive_outside.name
+    shutil.move(str(project_archive_outside), str(project_archive))
 
-    final_zip_path = None
+    final_zip_path = project_dir / f"{project_name}-{timestamp}.zip"
 
     try:
         compose_file = find_compose_file(project_dir)
@@ -305,63 +972,100 @@ def backup_project(project_dir, rclone_remote, remote_path, backups_to_keep: int
         else:
             print("WARNING: No named volumes detected in the compose file.")
 
-        docker_compose_cmd = detect_docker_compose_command()
+        docker_compose_cmd = list(docker_compose_cmd or detect_docker_compose_command())
         print(f"Using Docker Compose command: {' '.join(docker_compose_cmd)}")
 
-        # 3) docker compose down
-        print("Bringing services down...")
-        run_cmd(docker_compose_cmd + ["down"], cwd=str(project_dir))
-
-        # 4) Export each named volume into temp_dir
-        exported_archives = []
-        for vol in volumes:
-            print(f"Exporting volume: {vol}")
-            archive_path = export_volume(vol, temp_dir, timestamp)
-            exported_archives.append(archive_path)
-            print(f"Volume {vol} exported to: {archive_path}")
-
-        # 5) docker compose up -d
-        print("Bringing services back up...")
-        run_cmd(docker_compose_cmd + ["up", "-d"], cwd=str(project_dir))
-
-        # 6) Zip all exports (project zip + volume tarballs) into one final zip
-        final_zip_path = create_final_zip_from_temp(project_dir, temp_dir, timestamp)
+        # Prepare everything the exports need while the services are still
+        # running, so a missing tool or volume cannot leave the stack stopped.
+        image = None
+        mountpoints = None
+        if volumes and direct_host_tar:
+            if not host_tools_available(compression):
+                raise RuntimeError(
+                    f"--direct-host-tar needs tar and {COMPRESSORS[compression]['host_command'][0]} "
+                    "installed on the host"
+                )
+            mountpoints = volume_mountpoints(volumes)
+        elif volumes:
+            image = prepare_export_image(compression)
+
+        # 3-5) Stream the project archive and every named volume into one final zip.
+        # Members are already compressed, so they are stored as-is. The zip
+        # is built inside temp_dir (which later project archives exclude) and
+        # only moved next to the project once it is complete.
+        staging_zip_path = temp_dir / final_zip_path.name
+        print(f"Creating final backup zip at {staging_zip_path}")
+        with zipfile.ZipFile(staging_zip_path, "w", compression=zipfile.ZIP_STORED) as final_zip:
+            final_zip.write(project_archive, arcname=project_archive.name)
+
+            # 3) docker compose down
+            print("Bringing services down...")
+            run_cmd(docker_compose_cmd + ["down"], cwd=str(project_dir))
+
+            try:
+                # 4) Export each named volume into the final zip
+                export_volumes(
+                    volumes,
+                    final_zip,
+                    temp_dir,
+                    timestamp,
+                    compression,
+                    compression_level,
+                    parallel=parallel,
+                    mountpoints=mountpoints,
+                    image=image,
+                )
+            finally:
+                # 5) docker compose up -d, even when an export failed
+                print("Bringing services back up...")
+                run_cmd(docker_compose_cmd + ["up", "-d"], cwd=str(project_dir))
+        os.rename(staging_zip_path, final_zip_path)
         print(f"Final backup zip created: {final_zip_path}")
 
-        # 7) Copy final zip to rclone remote
+        # 7) Start copying the final zip to the rclone remote. With an
+        # upload queue, wait for the previous upload first so only one runs
+        # (and at most two final zips exist locally) at a time.
+        if upload_queue is not None:
+            upload_queue.join()
         print(f"Copying final backup zip to rclone remote {remote}:{remote_path or ''} ...")
-        rclone_copy_file(final_zip_path, remote, remote_path)
-        print("rclone copy completed.")
+        upload = rclone_copy_file(final_zip_path, remote, remote_path, rclone_args)
 
-        # 8) Remove local exports (temp directory with intermediate files)
+        # 8) Remove local exports while the upload runs; the final zip holds them all
         print(f"Removing temp backup directory: {temp_dir}")
         shutil.rmtree(temp_dir)
 
-        # 9) Remove local final backup zip as well
-        if final_zip_path.exists():
-            print(f"Removing local final backup zip: {final_zip_path}")
-            final_zip_path.unlink()
+        # 9-10) Wait for the upload, remove the local zip and rotate. In
+        # multi-project runs this is handed to the caller's upload queue so
+        # the next project can start while the upload is still running.
+        finish = functools.partial(
+            finish_backup_upload,
+            upload,
+            final_zip_path,
+            remote,
+            remote_path,
+            backups_to_keep,
+            listing,
+        )
+        if upload_queue is not None:
+            upload_queue.put((caller_project_dir, finish))
+            return final_zip_path
 
-        # 10) Rotate old backups on remote
-        print(f"Rotating backups on remote, keeping last {backups_to_keep} archives...")
-        rotate_project_backups(remote, remote_path, backups_to_keep)
-        print("Backup rotation completed.")
-        
-        print("\nBackup completed successfully.")
+        finish()
         return final_zip_path
 
     except Exception as e:
         print(f"\nERROR: {e}")
-        print(f"Temp backup directory preserved at: {temp_dir}")
-        if final_zip_path:
-            print(f"Final zip (if created) at: {final_zip_path}")
+        if temp_dir.exists():
+            print(f"Temp backup directory preserved at: {temp_dir}")
+        if final_zip_path.exists():
+            print(f"Final zip preserved at: {final_zip_path}")
         raise
 
 
 def main():
     parser = argparse.ArgumentParser(
         description=(
-            "Backup a Docker Compose project: project zip, volume exports, "
+            "Backup a Docker Compose project: project archive, volume exports, "
             "bundle into one zip, upload via rclone."
         )
     )
@@ -383,8 +1087,47 @@ def main():
         default=4,
         help="Number of most recent backups to keep on the remote (default: 4).",
     )
+    parser.add_argument(
+        "--compression",
+        choices=sorted(COMPRESSORS),
+        default=DEFAULT_COMPRESSION,
+        help="Compressor for volume exports: zstd (.tar.zst) or gzip via pigz (.tar.gz) (default: zstd).",
+    )
+    parser.add_argument(
+        "--compression-level",
+        type=int,
+        default=None,
+        help="Compression level for volume exports (default: 3 for zstd, 1 for gzip).",
+    )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        help=(
+            "Maximum number of volumes to export concurrently (default: 1). "
+            "Values above 1 stage exports in the temp directory first."
+        ),
+    )
+    parser.add_argument(
+        "--direct-host-tar",
+        action="store_true",
+        help=(
+            "Tar volumes straight from their host mountpoints with the host's tar "
+            "and compressor instead of a helper container (requires root)."
+        ),
+    )
+    parser.add_argument(
+        "--rclone-args",
+        type=shlex.split,
+        default=None,
+        help="Extra arguments for 'rclone copy', as one quoted string (e.g. --rclone-args='--transfers=4 --bwlimit=10M').",
+    )
 
     args = parser.parse_args()
+    try:
+        resolve_compression_level(args.compression, args.compression_level)
+    except ValueError as exc:
+        parser.error(str(exc))
 
     try:
         backup_project(
@@ -392,6 +1135,11 @@ def main():
             args.rclone_remote,
             args.remote_path,
             backups_to_keep=args.backups_to_keep,
+            compression=args.compression,
+            compression_level=args.compression_level,
+            parallel=args.parallel,
+            direct_host_tar=args.direct_host_tar,
+            rclone_args=args.rclone_args,
         )
     except Exception:
         sys.exit(1)
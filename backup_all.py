@@ -1,9 +1,23 @@
 #!/usr/bin/env python3
 import argparse
+import concurrent.futures
+import os
+import queue
+import shlex
 import sys
+import tempfile
+import threading
 from pathlib import Path
 
-from backup import backup_project
+from backup import (
+    COMPRESSORS,
+    DEFAULT_COMPRESSION,
+    backup_project,
+    detect_docker_compose_command,
+    extract_named_volumes,
+    find_compose_file,
+    resolve_compression_level,
+)
 
 
 def iter_project_dirs(root: Path):
@@ -20,14 +34,150 @@ def _project_remote_path(base_path: str, project_name: str) -> str:
     return project_name
 
 
-def backup_all_projects(rclone_remote: str, remote_path: str, projects_root: Path, backups_to_keep: int = 4):
+def _project_volumes(project_dir: Path):
+    """Return the named volumes a project uses, or an empty set if unknown."""
+    try:
+        return set(extract_named_volumes(find_compose_file(project_dir)))
+    except Exception:
+        # Let backup_project report the real problem later on.
+        return set()
+
+
+def _group_projects_by_volumes(project_dirs):
+    """
+    Group projects that share any named volume so they never run concurrently.
+
+    Groups keep the input order, both between and within groups.
+    """
+    groups = []
+    for project_dir in project_dirs:
+        volumes = _project_volumes(project_dir)
+        overlapping = [g for g in groups if g["volumes"] & volumes]
+        merged = {"projects": [], "volumes": set(volumes)}
+        for group in overlapping:
+            merged["projects"].extend(group["projects"])
+            merged["volumes"] |= group["volumes"]
+            groups.remove(group)
+        merged["projects"].append(project_dir)
+        merged["projects"].sort(key=project_dirs.index)
+        groups.append(merged)
+
+    groups.sort(key=lambda g: project_dirs.index(g["projects"][0]))
+    return [g["projects"] for g in groups]
+
+
+def _drain_uploads(upload_queue, failures):
+    """Finish queued uploads in order until a None sentinel is received."""
+    while True:
+        item = upload_queue.get()
+        if item is None:
+            return
+        project_dir, finish = item
+        try:
+            finish()
+        except Exception as exc:
+            failures.append((project_dir, str(exc)))
+            print(f"ERROR: Upload failed for {project_dir}: {exc}")
+        finally:
+            # Lets backup_project's upload_queue.join() start the next upload
+            upload_queue.task_done()
+
+
+def _backup_group(project_dirs, rclone_remote: str, remote_path: str, options):
+    """
+    Back up the given projects one after another.
+
+    Uploads are finished by a background thread, so the next project's
+    backup starts while the previous archive is still being uploaded. Only
+    one upload runs at a time.
+
+    Returns a list of (project_dir, error message) tuples for failed projects.
+    """
+    failures = []
+    upload_queue = queue.Queue()
+    uploader = threading.Thread(target=_drain_uploads, args=(upload_queue, failures))
+    uploader.start()
+    try:
+        for project_dir in project_dirs:
+            print("\n" + "=" * 80)
+            print(f"Starting backup for project: {project_dir.name} ({project_dir})")
+            print("=" * 80)
+            project_remote_path = _project_remote_path(remote_path, project_dir.name)
+            try:
+                backup_project(
+                    project_dir,
+                    rclone_remote,
+                    project_remote_path,
+                    upload_queue=upload_queue,
+                    **options,
+                )
+            except Exception as exc:
+                failures.append((project_dir, str(exc)))
+                print(f"ERROR: Backup failed for {project_dir}: {exc}")
+    finally:
+        upload_queue.put(None)
+        uploader.join()
+    return failures
+
+
+def _backup_group_buffered(project_dirs, rclone_remote: str, remote_path: str, options):
+    """
+    Run _backup_group in a worker process with all of its output buffered.
+
+    stdout/stderr are redirected at the file descriptor level so output of
+    child commands (docker, rclone) is captured too. Returns the failures and
+    the captured output so the parent can print each group in one piece.
+    """
+    with tempfile.TemporaryFile() as log:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        saved_fds = os.dup(1), os.dup(2)
+        os.dup2(log.fileno(), 1)
+        os.dup2(log.fileno(), 2)
+        try:
+            failures = _backup_group(project_dirs, rclone_remote, remote_path, options)
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved_fds[0], 1)
+            os.dup2(saved_fds[1], 2)
+            os.close(saved_fds[0])
+            os.close(saved_fds[1])
+        log.seek(0)
+        output = log.read().decode("utf-8", errors="replace")
+    return failures, output
+
+
+def _failure_order(project_dirs):
+    """Sort key putting failures in project order (unknown paths last)."""
+    positions = {project_dir: index for index, project_dir in enumerate(project_dirs)}
+    return lambda failure: positions.get(failure[0], len(positions))
+
+
+def backup_all_projects(
+    rclone_remote: str,
+    remote_path: str,
+    projects_root: Path,
+    backups_to_keep: int = 4,
+    compression: str = DEFAULT_COMPRESSION,
+    compression_level=None,
+    parallel: int = 1,
+    direct_host_tar: bool = False,
+    rclone_args=None,
+):
     """
     Run backups for every project directory inside projects_root.
 
     Each project is processed independently using backup_project with the same
     rclone settings. Failures are collected and reported at the end so one bad
     project does not stop the rest.
+
+    With parallel > 1, up to that many projects are backed up at once in
+    separate processes, and each project's output is printed when it
+    finishes. Projects sharing a named volume are still run one after
+    another.
     """
+    resolve_compression_level(compression, compression_level)
     projects_root = Path(projects_root).resolve()
     if not projects_root.is_dir():
         raise FileNotFoundError(
@@ -38,22 +188,33 @@ def backup_all_projects(rclone_remote: str, remote_path: str, projects_root: Pat
     if not project_dirs:
         raise FileNotFoundError(f"No project directories found in {projects_root}")
 
-    failures = []
-    for project_dir in project_dirs:
-        print("\n" + "=" * 80)
-        print(f"Starting backup for project: {project_dir.name} ({project_dir})")
-        print("=" * 80)
-        project_remote_path = _project_remote_path(remote_path, project_dir.name)
-        try:
-            backup_project(
-                project_dir,
-                rclone_remote,
-                project_remote_path,
-                backups_to_keep=backups_to_keep,
-            )
-        except Exception as exc:
-            failures.append((project_dir, exc))
-            print(f"ERROR: Backup failed for {project_dir}: {exc}")
+    options = {
+        "backups_to_keep": backups_to_keep,
+        "compression": compression,
+        "compression_level": compression_level,
+        "direct_host_tar": direct_host_tar,
+        "rclone_args": rclone_args,
+        "docker_compose_cmd": detect_docker_compose_command(),
+    }
+
+    if parallel <= 1:
+        failures = _backup_group(project_dirs, rclone_remote, remote_path, options)
+        failures.sort(key=_failure_order(project_dirs))
+    else:
+        groups = _group_projects_by_volumes(project_dirs)
+        workers = min(parallel, len(groups))
+        print(f"Backing up {len(project_dirs)} projects in {len(groups)} groups with {workers} workers...")
+        failures = []
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_backup_group_buffered, group, rclone_remote, remote_path, options)
+                for group in groups
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                group_failures, output = future.result()
+                print(output, end="", flush=True)
+                failures.extend(group_failures)
+        failures.sort(key=_failure_order(project_dirs))
 
     if failures:
         summary = "; ".join(f"{p.name}: {err}" for p, err in failures)
@@ -85,8 +246,47 @@ def main():
         default=4,
         help="Number of most recent backups to keep on the remote (default: 4).",
     )
+    parser.add_argument(
+        "--compression",
+        choices=sorted(COMPRESSORS),
+        default=DEFAULT_COMPRESSION,
+        help="Compressor for volume exports: zstd (.tar.zst) or gzip via pigz (.tar.gz) (default: zstd).",
+    )
+    parser.add_argument(
+        "--compression-level",
+        type=int,
+        default=None,
+        help="Compression level for volume exports (default: 3 for zstd, 1 for gzip).",
+    )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        help=(
+            "Number of projects to back up concurrently (default: 1). "
+            "Projects sharing a named volume still run one after another."
+        ),
+    )
+    parser.add_argument(
+        "--direct-host-tar",
+        action="store_true",
+        help=(
+            "Tar volumes straight from their host mountpoints with the host's tar "
+            "and compressor instead of a helper container (requires root)."
+        ),
+    )
+    parser.add_argument(
+        "--rclone-args",
+        type=shlex.split,
+        default=None,
+        help="Extra arguments for 'rclone copy', as one quoted string (e.g. --rclone-args='--transfers=4 --bwlimit=10M').",
+    )
 
     args = parser.parse_args()
+    try:
+        resolve_compression_level(args.compression, args.compression_level)
+    except ValueError as exc:
+        parser.error(str(exc))
 
     try:
         backup_all_projects(
@@ -94,6 +294,11 @@ def main():
             args.remote_path,
             args.projects_dir,
             backups_to_keep=args.backups_to_keep,
+            compression=args.compression,
+            compression_level=args.compression_level,
+            parallel=args.parallel,
+            direct_host_tar=args.direct_host_tar,
+            rclone_args=args.rclone_args,
         )
     except Exception as exc:
         print(f"\nERROR: {exc}")